@@ -99,7 +99,7 @@ function DashboardPage() {
   
   const processEmotionChartData = (entries) => {
       const emotionCounts = entries
-          .flatMap(entry => entry.detected_emotions || [])
+          .flatMap(entry => (Array.isArray(entry.detected_emotions_data) ? entry.detected_emotions_data : []))
           .reduce((acc, emotion) => {
               const capitalized = emotion.charAt(0).toUpperCase() + emotion.slice(1);
               acc[capitalized] = (acc[capitalized] || 0) + 1;
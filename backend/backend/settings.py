@@ -14,6 +14,7 @@ from pathlib import Path
 import os
 from decouple import config
 import dj_database_url
+from corsheaders.defaults import default_headers
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -53,6 +54,8 @@ MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     # Add whitenoise middleware
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    # Gzip/Brotli for API responses; WhiteNoise already serves pre-compressed static files
+    'soul_log.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -85,12 +88,28 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 
 # Database configuration
 # Use dj-database-url to parse the DATABASE_URL environment variable
+# Connections are kept open for DB_CONN_MAX_AGE seconds and health-checked before
+# reuse, so short API calls don't pay connection setup on every request.
+# Setting DB_POOL=1 on PostgreSQL switches to a psycopg3 connection pool instead
+# (requires `pip install "psycopg[binary,pool]"`); Django's pool manages
+# connection reuse itself, so persistent connections are disabled in that mode.
+DB_POOL = config('DB_POOL', default='0') == '1'
+
 DATABASES = {
     'default': dj_database_url.config(
-        default=config('DATABASE_URL', default='sqlite:///' + os.path.join(BASE_DIR, 'db.sqlite3'))
+        default=config('DATABASE_URL', default='sqlite:///' + os.path.join(BASE_DIR, 'db.sqlite3')),
+        conn_max_age=0 if DB_POOL else config('DB_CONN_MAX_AGE', default=600, cast=int),
+        conn_health_checks=config('DB_CONN_HEALTH_CHECKS', default='1') == '1',
     )
 }
 
+if DB_POOL and DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    DATABASES['default'].setdefault('OPTIONS', {})['pool'] = {
+        'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+        'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+        'timeout': config('DB_POOL_TIMEOUT', default=10, cast=int),
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -148,3 +167,83 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 CORS_ALLOWED_ORIGINS = config('CORS_ALLOWED_ORIGINS', default='http://localhost:3000,http://127.0.0.1:3000').split(',')
+# Let the frontend send idempotency/concurrency headers and read the ones we return.
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key', 'if-match')
+CORS_EXPOSE_HEADERS = ['ETag', 'Retry-After', 'Idempotent-Replayed']
+
+
+# Cache
+# Throttle buckets and the analysis admission counter live here, so production
+# deployments with several workers should point this at a shared backend such as
+# django.core.cache.backends.redis.RedisCache.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='soul-log'),
+    }
+}
+
+
+# Per-user caching of profiles and dashboard stats
+# A small per-process LRU sits in front of the cache above. Writes invalidate both
+# tiers through model signals, but only in the worker that made the write, so
+# CACHE_LOCAL_TTL bounds how stale another worker's copy can be.
+SOUL_LOG_CACHE = {
+    'LOCAL_MAX_ENTRIES': config('CACHE_LOCAL_MAX_ENTRIES', default=1024, cast=int),
+    'LOCAL_TTL': config('CACHE_LOCAL_TTL', default=5, cast=int),
+    'SHARED_TTL': config('CACHE_SHARED_TTL', default=300, cast=int),
+}
+
+
+# Number of users whose similar-entries index each worker keeps in memory
+SOUL_LOG_SIMILARITY_CACHED_USERS = config('SIMILARITY_CACHED_USERS', default=256, cast=int)
+
+# How long an Idempotency-Key on entry creation is remembered, in seconds
+SOUL_LOG_IDEMPOTENCY_KEY_TTL = config('IDEMPOTENCY_KEY_TTL', default=86400, cast=int)
+# A key still in flight after this many seconds is treated as abandoned (e.g. the
+# worker was killed) and can be claimed by a retry; keep it above the worker timeout.
+SOUL_LOG_IDEMPOTENCY_CLAIM_LEASE = config('IDEMPOTENCY_CLAIM_LEASE', default=60, cast=int)
+
+# Import TextBlob/NLTK when a WSGI worker boots rather than on the first analysis
+SOUL_LOG_PRELOAD_NLP = config('PRELOAD_NLP', default='0') == '1'
+
+# Entries older than this are moved to the archive tables by `manage.py archive_entries`
+SOUL_LOG_ARCHIVE_AFTER_DAYS = config('ARCHIVE_AFTER_DAYS', default=365, cast=int)
+
+# Admin changelists count at most this many rows exactly; larger unfiltered
+# PostgreSQL tables use the planner's estimate instead.
+SOUL_LOG_ADMIN_COUNT_LIMIT = config('ADMIN_COUNT_LIMIT', default=10000, cast=int)
+
+
+# API rendering, rate limiting and admission control
+# Rates use DRF's '<requests>/<period>' format; the request count is the token
+# bucket capacity. Set a rate to an empty string to disable that throttle.
+# NUM_PROXIES is the number of reverse proxies in front of the app; client IPs
+# are taken from X-Forwarded-For only when it is set, since the header is
+# otherwise supplied by the client and would let it pick its own throttle key.
+# Render (which sets RENDER=true) fronts the app with one proxy; without it
+# every client would share the proxy's IP and a single ip/login/register bucket.
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'soul_log.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'soul_log.throttling.UserTokenBucketThrottle',
+        'soul_log.throttling.IPTokenBucketThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'user': config('THROTTLE_RATE_USER', default='300/min'),
+        'ip': config('THROTTLE_RATE_IP', default='600/min'),
+        'login': config('THROTTLE_RATE_LOGIN', default='10/min'),
+        'register': config('THROTTLE_RATE_REGISTER', default='5/hour'),
+        'login_account': config('THROTTLE_RATE_LOGIN_ACCOUNT', default='20/hour'),
+        'entry_create': config('THROTTLE_RATE_ENTRY_CREATE', default='30/min'),
+    },
+    'NUM_PROXIES': config('NUM_PROXIES', default=1 if config('RENDER', default='') else 0, cast=int),
+}
+
+# Maximum number of entry analyses running at once across all workers (0 disables the cap)
+SOUL_LOG_ANALYSIS_MAX_IN_FLIGHT = config('ANALYSIS_MAX_IN_FLIGHT', default=8, cast=int)
+SOUL_LOG_ANALYSIS_RETRY_AFTER = config('ANALYSIS_RETRY_AFTER', default=5, cast=int)
+SOUL_LOG_ANALYSIS_SLOT_TTL = config('ANALYSIS_SLOT_TTL', default=300, cast=int)
@@ -14,3 +14,11 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
 
 application = get_wsgi_application()
+
+# Optionally pay the NLP import cost at worker boot (or once in the gunicorn
+# master with --preload) instead of on the first entry a user submits.
+from django.conf import settings
+
+if settings.SOUL_LOG_PRELOAD_NLP:
+    from soul_log.ai_service import preload_nlp
+    preload_nlp()
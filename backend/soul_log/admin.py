@@ -1,27 +1,96 @@
+from django.conf import settings
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
 from .models import UserProfile, JournalEntry, GeneratedInsight, InsightTemplate
 
 # Corrected admin registration using the actual field names from your models.py
 
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that never runs an unbounded COUNT(*).
+
+    Unfiltered changelists on PostgreSQL use the planner's row estimate from
+    pg_class; everything else is counted exactly, but only up to
+    SOUL_LOG_ADMIN_COUNT_LIMIT rows.
+    """
+
+    @cached_property
+    def count(self):
+        limit = settings.SOUL_LOG_ADMIN_COUNT_LIMIT
+        queryset = self.object_list
+
+        if not queryset.query.where:
+            estimate = self._estimated_count(queryset)
+            if estimate is not None and estimate > limit:
+                return estimate
+
+        return queryset[:limit].count()
+
+    def _estimated_count(self, queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 until the table has been vacuumed or analyzed.
+        if row is None or row[0] < 0:
+            return None
+        return row[0]
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """Changelist settings for tables expected to reach millions of rows."""
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+
+
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = ('user', 'prefer_biblical', 'prefer_islamic', 'prefer_psychological')
+    list_select_related = ('user',)
     search_fields = ('user__username',)
+    autocomplete_fields = ('user',)
 
 @admin.register(JournalEntry)
-class JournalEntryAdmin(admin.ModelAdmin):
+class JournalEntryAdmin(LargeTableAdmin):
     list_display = ('user', 'title', 'created_at', 'mood_rating', 'sentiment_score')
-    list_filter = ('created_at', 'mood_rating', 'user')
-    search_fields = ('title', 'content')
-    date_hierarchy = 'created_at'
+    list_select_related = ('user',)
+    # Bounded filters only: no per-user choices and no date_hierarchy, which
+    # scans the whole table for distinct dates.
+    list_filter = ('created_at', 'mood_rating')
+    # Exact, index-backed lookups instead of icontains over content.
+    search_fields = ('user__username__exact',)
+    search_help_text = 'Exact username, or an entry ID.'
+    autocomplete_fields = ('user',)
+
+    def get_search_results(self, request, queryset, search_term):
+        if search_term.strip().isdigit():
+            return queryset.filter(pk=search_term.strip()), False
+        return super().get_search_results(request, queryset, search_term)
 
 @admin.register(GeneratedInsight)
-class GeneratedInsightAdmin(admin.ModelAdmin):
+class GeneratedInsightAdmin(LargeTableAdmin):
     # Corrected: Using 'journal_entry' which is the correct field name.
     list_display = ('journal_entry', 'insight_type', 'title', 'created_at')
+    list_select_related = ('journal_entry__user',)
     list_filter = ('insight_type',)
-    search_fields = ('title', 'content')
-    date_hierarchy = 'created_at'
+    search_fields = ('journal_entry__user__username__exact',)
+    search_help_text = 'Exact username, or a journal entry ID.'
+    raw_id_fields = ('journal_entry',)
+
+    def get_search_results(self, request, queryset, search_term):
+        if search_term.strip().isdigit():
+            return queryset.filter(journal_entry_id=search_term.strip()), False
+        return super().get_search_results(request, queryset, search_term)
 
 @admin.register(InsightTemplate)
 class InsightTemplateAdmin(admin.ModelAdmin):
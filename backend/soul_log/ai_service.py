@@ -1,18 +1,30 @@
 # backend/soul_log/ai_service.py
 
-from textblob import TextBlob
+import functools
 import json
 import re
 from typing import Dict, Any
 
+@functools.cache
+def load_textblob():
+    """
+    Import TextBlob on first use.
+
+    TextBlob pulls in NLTK, which dominates import time, so only the analysis
+    path pays for it. Serving workers can call preload_nlp() at boot instead.
+    """
+    from textblob import TextBlob
+    return TextBlob
+
+def preload_nlp():
+    """Import TextBlob and load its sentiment lexicon ahead of the first request."""
+    load_textblob()("warm up").sentiment
+
 class AIInsightService:
     """
     AI service using TextBlob for reliable sentiment analysis and insight generation
     """
 
-    def __init__(self):
-        print("TextBlob AI service initialized successfully!")
-
     def analyze_journal_entry(self, entry_content: str, preferences: Dict[str, bool]) -> Dict[str, Any]:
         """
         Analyzes journal entry using TextBlob and returns structured insights
@@ -28,7 +40,7 @@ class AIInsightService:
 
         try:
             # 1. Sentiment Analysis using TextBlob
-            blob = TextBlob(entry_content)
+            blob = load_textblob()(entry_content)
             sentiment_score = blob.sentiment.polarity  # -1 to 1
 
             # 2. Keyword Extraction (simple but effective)
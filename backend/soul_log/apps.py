@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class SoulLogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'soul_log'
+
+    def ready(self):
+        # Connect cache invalidation receivers.
+        from . import signals  # noqa: F401
@@ -1,7 +1,7 @@
 # backend/soul_log/authentication.py
 
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes, authentication_classes
+from rest_framework.decorators import api_view, permission_classes, authentication_classes, throttle_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.response import Response
@@ -10,9 +10,11 @@ from django.contrib.auth import authenticate
 from rest_framework.authtoken.models import Token
 
 from .serializers import UserRegistrationSerializer
+from .throttling import IPTokenBucketThrottle, LoginAccountThrottle, LoginThrottle, RegisterThrottle
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([IPTokenBucketThrottle, RegisterThrottle])
 def register(request):
     """Register a new user and return a token."""
     serializer = UserRegistrationSerializer(data=request.data)
@@ -28,6 +30,7 @@ def register(request):
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@throttle_classes([IPTokenBucketThrottle, LoginThrottle, LoginAccountThrottle])
 def login_view(request):
     """Login user and return token"""
     email = request.data.get('email')
@@ -0,0 +1,148 @@
+# backend/soul_log/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache as shared_cache
+from django.db import transaction
+
+_MISSING = object()
+
+
+class LocalLRUCache:
+    """
+    Small thread-safe per-process LRU with a per-item TTL.
+
+    Entries are evicted least-recently-used first once `max_entries` is
+    reached, and are treated as missing once older than `ttl` seconds.
+    """
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            value, expires_at = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TieredCache:
+    """
+    Per-process LRU (L1) in front of Django's shared cache (L2).
+
+    Deletes clear both tiers, but only the L1 of the process that handled the
+    write; other workers can serve a stale L1 value for up to its TTL, so keep
+    `local_ttl` short.
+    """
+
+    def __init__(self, prefix, local_max_entries, local_ttl, shared_ttl):
+        self.prefix = prefix
+        self.shared_ttl = shared_ttl
+        self.local = LocalLRUCache(local_max_entries, local_ttl)
+        self._counts = {'local_hits': 0, 'shared_hits': 0, 'misses': 0}
+        self._counts_lock = threading.Lock()
+
+    def _count(self, name):
+        with self._counts_lock:
+            self._counts[name] += 1
+
+    def get_or_set(self, key, default_func):
+        """Return the cached value for `key`, computing and storing it on a miss."""
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            self._count('local_hits')
+            return value
+
+        value = shared_cache.get(self.prefix + key, _MISSING)
+        if value is not _MISSING:
+            self._count('shared_hits')
+        else:
+            self._count('misses')
+            value = default_func()
+            shared_cache.set(self.prefix + key, value, self.shared_ttl)
+
+        self.local.set(key, value)
+        return value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.local.delete(key)
+        shared_cache.delete_many([self.prefix + key for key in keys])
+
+    def stats(self):
+        """Return this process's hit/miss counters and hit rate."""
+        with self._counts_lock:
+            counts = dict(self._counts)
+        lookups = sum(counts.values())
+        hits = counts['local_hits'] + counts['shared_hits']
+        return {
+            **counts,
+            'hit_rate': round(hits / lookups, 3) if lookups else None,
+            'local_size': len(self.local),
+        }
+
+
+user_cache = TieredCache(
+    prefix='soul_log:user:',
+    local_max_entries=settings.SOUL_LOG_CACHE['LOCAL_MAX_ENTRIES'],
+    local_ttl=settings.SOUL_LOG_CACHE['LOCAL_TTL'],
+    shared_ttl=settings.SOUL_LOG_CACHE['SHARED_TTL'],
+)
+
+
+def profile_key(user_id):
+    return f'profile:{user_id}'
+
+
+def dashboard_key(user_id):
+    return f'dashboard:{user_id}'
+
+
+def _delete_on_commit(key):
+    """
+    Drop `key` once the surrounding transaction commits (immediately outside one).
+
+    Deleting earlier would let a request landing before the commit re-cache
+    the old rows for SHARED_TTL.
+    """
+    transaction.on_commit(lambda: user_cache.delete(key))
+
+
+def invalidate_profile(user_id):
+    _delete_on_commit(profile_key(user_id))
+
+
+def invalidate_dashboard(user_id):
+    _delete_on_commit(dashboard_key(user_id))
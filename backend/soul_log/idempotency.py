@@ -0,0 +1,85 @@
+# backend/soul_log/idempotency.py
+
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import IdempotencyKey
+
+MAX_KEY_LENGTH = IdempotencyKey._meta.get_field('key').max_length
+
+
+def request_fingerprint(data):
+    """Return a SHA-256 of the request body that ignores key order."""
+    body = json.dumps(data, cls=JSONEncoder, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+def claim(user, key, fingerprint):
+    """
+    Claim `key` for a new request, or find out how to answer a retry.
+
+    Returns (record, None) when the caller should process the request and then
+    call complete() or release(). Returns (None, response) when the caller
+    should return `response` as-is: a replay of the stored response, or an
+    error if the key is still in flight or was used for a different body.
+    """
+    now = timezone.now()
+    expired_before = now - timedelta(seconds=settings.SOUL_LOG_IDEMPOTENCY_KEY_TTL)
+    IdempotencyKey.objects.filter(user=user, key=key, created_at__lt=expired_before).delete()
+    # A claim that never completed past its lease belongs to a request whose
+    # worker died without releasing it; drop it so this retry can claim the key.
+    abandoned_before = now - timedelta(seconds=settings.SOUL_LOG_IDEMPOTENCY_CLAIM_LEASE)
+    IdempotencyKey.objects.filter(
+        user=user, key=key, response_status__isnull=True, created_at__lt=abandoned_before,
+    ).delete()
+
+    try:
+        with transaction.atomic():
+            return IdempotencyKey.objects.create(user=user, key=key, request_hash=fingerprint), None
+    except IntegrityError:
+        pass
+
+    record = IdempotencyKey.objects.filter(user=user, key=key).first()
+    if record is None:
+        # Released by the original request between our insert and this read.
+        return claim(user, key, fingerprint)
+
+    if record.request_hash != fingerprint:
+        return None, Response(
+            {'error': 'Idempotency-Key was already used with a different request body.'},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    if record.response_status is None:
+        return None, Response(
+            {'error': 'A request with this Idempotency-Key is still being processed.'},
+            status=status.HTTP_409_CONFLICT,
+            headers={'Retry-After': '1'},
+        )
+    return None, Response(
+        json.loads(record.response_body),
+        status=record.response_status,
+        headers={'Idempotent-Replayed': 'true'},
+    )
+
+
+def complete(record, response):
+    """Store a successful response so retries replay it."""
+    # An update rather than save(): if this request outlived its lease the
+    # record may have been dropped and re-claimed by a retry.
+    IdempotencyKey.objects.filter(pk=record.pk, response_status__isnull=True).update(
+        response_status=response.status_code,
+        response_body=json.dumps(response.data, cls=JSONEncoder),
+    )
+
+
+def release(record):
+    """Forget the key so the client can retry after a failure."""
+    IdempotencyKey.objects.filter(pk=record.pk, response_status__isnull=True).delete()
@@ -0,0 +1,70 @@
+# backend/soul_log/management/commands/archive_entries.py
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from soul_log.models import JournalEntry, GeneratedInsight, ArchivedJournalEntry, ArchivedInsight
+
+ENTRY_FIELDS = [
+    'id', 'user_id', 'title', 'content', 'mood_rating', 'emotions', 'created_at',
+    'updated_at', 'version', 'sentiment_score', 'detected_emotions', 'keywords',
+]
+INSIGHT_FIELDS = [
+    'id', 'journal_entry_id', 'insight_type', 'title', 'content', 'scripture_reference', 'created_at',
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Move journal entries older than the archive horizon, with their insights, "
+        "into the archive tables. Each chunk is copied and deleted in its own transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=settings.SOUL_LOG_ARCHIVE_AFTER_DAYS,
+            help='Archive entries created more than this many days ago.',
+        )
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Entries moved per transaction.')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many entries would move.')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        old_entries = JournalEntry.objects.filter(created_at__lt=cutoff)
+
+        if options['dry_run']:
+            self.stdout.write(f"{old_entries.count()} entries created before {cutoff:%Y-%m-%d} would be archived.")
+            return
+
+        total = 0
+        while True:
+            moved = self._archive_chunk(old_entries, options['chunk_size'])
+            if not moved:
+                break
+            total += moved
+            self.stdout.write(f"Archived {total} entries...")
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {total} entries created before {cutoff:%Y-%m-%d}."))
+
+    @transaction.atomic
+    def _archive_chunk(self, old_entries, chunk_size):
+        entries = list(
+            old_entries.order_by('created_at').select_for_update(skip_locked=True)
+            .values(*ENTRY_FIELDS)[:chunk_size]
+        )
+        if not entries:
+            return 0
+
+        entry_ids = [entry['id'] for entry in entries]
+        insights = GeneratedInsight.objects.filter(journal_entry_id__in=entry_ids).values(*INSIGHT_FIELDS)
+
+        ArchivedJournalEntry.objects.bulk_create(ArchivedJournalEntry(**entry) for entry in entries)
+        ArchivedInsight.objects.bulk_create(ArchivedInsight(**insight) for insight in insights)
+        # Cascades to the insights; the delete signals invalidate cached dashboards.
+        JournalEntry.objects.filter(pk__in=entry_ids).delete()
+
+        return len(entries)
@@ -0,0 +1,98 @@
+# backend/soul_log/management/commands/bench_db_connections.py
+
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+from rest_framework.authtoken.models import Token
+
+from soul_log.cache import user_cache, profile_key, dashboard_key
+from soul_log.management.wsgi_client import call
+
+ENDPOINTS = ['/api/entries/', '/api/dashboard/']
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-request connection setup against the configured persistent "
+        "connection/pool settings on the entries and dashboard endpoints."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', required=True, help='Existing user to issue requests as.')
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint and mode.')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['username']}' does not exist.")
+        token, created = Token.objects.get_or_create(user=user)
+
+        # Go through the real WSGI handler so request_started/request_finished
+        # open and close connections exactly as they do under gunicorn.
+        handler = WSGIHandler()
+        connect_times = []
+        original_connect = connection.connect
+
+        def timed_connect():
+            start = time.perf_counter()
+            original_connect()
+            connect_times.append(time.perf_counter() - start)
+
+        configured = dict(connection.settings_dict)
+        configured['OPTIONS'] = dict(configured['OPTIONS'])
+        per_request = dict(configured, CONN_MAX_AGE=0)
+        per_request['OPTIONS'] = {k: v for k, v in configured['OPTIONS'].items() if k != 'pool'}
+
+        modes = [('per-request', per_request), ('configured', configured)]
+        # Keep the benchmark traffic from being shed by the API throttles.
+        rest_framework = dict(settings.REST_FRAMEWORK, DEFAULT_THROTTLE_RATES={})
+
+        connection.connect = timed_connect
+        try:
+            with override_settings(REST_FRAMEWORK=rest_framework):
+                for mode, settings_dict in modes:
+                    connection.close()
+                    connection.settings_dict.clear()
+                    connection.settings_dict.update(settings_dict)
+                    for path in ENDPOINTS:
+                        connect_times.clear()
+                        latencies = [
+                            self._request(handler, path, token.key, user.pk)
+                            for _ in range(options['requests'])
+                        ]
+                        self._report(mode, path, latencies, connect_times)
+        finally:
+            del connection.connect
+            connection.close()
+            connection.settings_dict.clear()
+            connection.settings_dict.update(configured)
+
+    def _request(self, handler, path, token, user_id):
+        # Otherwise every dashboard request after the first is a cache hit
+        # and we'd be timing the cache rather than connection setup.
+        user_cache.delete(profile_key(user_id), dashboard_key(user_id))
+        start = time.perf_counter()
+        status_code, content = call(handler, 'GET', path, token)
+        elapsed = time.perf_counter() - start
+
+        if status_code != 200:
+            raise CommandError(f'{path} returned {status_code}.')
+        return elapsed
+
+    def _report(self, mode, path, latencies, connect_times):
+        latencies = sorted(latencies)
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        self.stdout.write(
+            f"{mode:<12} {path:<18} "
+            f"mean={statistics.mean(latencies) * 1000:.2f}ms "
+            f"p95={p95 * 1000:.2f}ms "
+            f"connects={len(connect_times)} "
+            f"connect_total={sum(connect_times) * 1000:.2f}ms"
+        )
@@ -0,0 +1,83 @@
+# backend/soul_log/management/commands/bench_importtime.py
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Boot the way a gunicorn worker does, including the URLconf (and so every
+# view module) that the first request would otherwise import.
+WORKER_BOOT = (
+    "import backend.wsgi; "
+    "from django.urls import get_resolver; "
+    "get_resolver().url_patterns"
+)
+
+# Modules that must stay off the cold-start path; they belong to analysis only.
+LAZY_MODULES = ('textblob', 'nltk', 'numpy')
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure cold start of `manage.py check` and of a WSGI worker boot in fresh "
+        "interpreters, and fail if either exceeds its budget or imports NLP/NumPy eagerly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters per target.')
+        parser.add_argument('--check-budget-ms', type=float, default=1000, help='Median budget for `manage.py check`.')
+        parser.add_argument('--worker-budget-ms', type=float, default=1000, help='Median budget for a worker boot.')
+        parser.add_argument('--top', type=int, default=10, help='Number of slowest top-level imports to list.')
+
+    def handle(self, *args, **options):
+        targets = [
+            ('manage.py check', [sys.executable, '-X', 'importtime', 'manage.py', 'check'], options['check_budget_ms']),
+            ('worker boot', [sys.executable, '-X', 'importtime', '-c', WORKER_BOOT], options['worker_budget_ms']),
+        ]
+        # Measure the lazy path even if the current environment opts into preloading.
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='backend.settings', PRELOAD_NLP='0')
+
+        failures = []
+        for name, command, budget in targets:
+            timings = []
+            for _ in range(options['runs']):
+                start = time.perf_counter()
+                result = subprocess.run(command, cwd=settings.BASE_DIR, env=env, capture_output=True, text=True)
+                timings.append((time.perf_counter() - start) * 1000)
+                if result.returncode != 0:
+                    raise CommandError(f"{name} failed:\n{result.stderr}")
+
+            imports, loaded = self._parse_importtime(result.stderr)
+            median = statistics.median(timings)
+            self.stdout.write(f"{name}: median={median:.0f}ms budget={budget:.0f}ms")
+            for module, cumulative in sorted(imports.items(), key=lambda item: -item[1])[:options['top']]:
+                self.stdout.write(f"    {cumulative / 1000:8.1f}ms  {module}")
+
+            if median > budget:
+                failures.append(f"{name} took {median:.0f}ms (budget {budget:.0f}ms)")
+            eager = [module for module in LAZY_MODULES if module in loaded]
+            if eager:
+                failures.append(f"{name} imported {', '.join(eager)} at startup")
+
+        if failures:
+            raise CommandError('; '.join(failures))
+        self.stdout.write(self.style.SUCCESS('Cold start is within budget.'))
+
+    def _parse_importtime(self, stderr):
+        """
+        Parse `-X importtime` output into ({top-level module: cumulative microseconds},
+        set of every module name loaded).
+        """
+        imports, loaded = {}, set()
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            self_us, cumulative_us, module = line[len('import time:'):].split('|')
+            loaded.add(module.strip())
+            if not module.startswith('  '):  # Nested imports are already counted in their parent
+                imports[module.strip()] = int(cumulative_us)
+        return imports, loaded
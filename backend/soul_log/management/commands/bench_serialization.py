@@ -0,0 +1,95 @@
+# backend/soul_log/management/commands/bench_serialization.py
+
+import gzip
+import json
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from soul_log.middleware import brotli
+from soul_log.models import JournalEntry, GeneratedInsight
+from soul_log.renderers import ORJSONRenderer
+from soul_log.serializers import JournalEntryWithInsightsSerializer, JournalEntryListSerializer
+
+SAMPLE_CONTENT = (
+    "Today was stressful at work but I felt grateful for my friends. "
+    "I worry about the deadline, yet I hope things will settle soon. "
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare payload size and serialization time of the entry list before "
+        "(ModelSerializer + JSONRenderer) and after (lean serializer + orjson). "
+        "Runs on synthetic data inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entries', type=int, default=500, help='Number of synthetic entries.')
+        parser.add_argument('--repeat', type=int, default=10, help='Timing repetitions per variant.')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self._seed(options['entries'])
+            entries = list(
+                JournalEntry.objects.filter(user__username='bench-serialization').prefetch_related('insights')
+            )
+
+            variants = [
+                ('before', JournalEntryWithInsightsSerializer, JSONRenderer()),
+                ('after', JournalEntryListSerializer, ORJSONRenderer()),
+            ]
+            for name, serializer_class, renderer in variants:
+                self._report(name, serializer_class, renderer, entries, options['repeat'])
+
+            transaction.set_rollback(True)
+
+    def _seed(self, count):
+        user = User.objects.create_user('bench-serialization', 'bench@example.com')
+        entries = JournalEntry.objects.bulk_create(
+            JournalEntry(
+                user=user,
+                title=f'Entry {i}',
+                content=SAMPLE_CONTENT * 3,
+                mood_rating=i % 5 + 1,
+                emotions='stress,hope',
+                sentiment_score=0.12,
+                detected_emotions=json.dumps(['stress', 'anxiety', 'hope']),
+                keywords='today,stressful,grateful,friends,worry,deadline,hope',
+            )
+            for i in range(count)
+        )
+        GeneratedInsight.objects.bulk_create(
+            GeneratedInsight(
+                journal_entry=entry,
+                insight_type=insight_type,
+                title='Managing Stress and Overwhelm',
+                content=SAMPLE_CONTENT,
+                scripture_reference='"Come to me, all you who are weary." - Matthew 11:28',
+            )
+            for entry in entries
+            for insight_type in ('psychological', 'biblical', 'islamic')
+        )
+
+    def _report(self, name, serializer_class, renderer, entries, repeat):
+        serialize_times, render_times = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            data = serializer_class(entries, many=True).data
+            serialized = time.perf_counter()
+            body = renderer.render(data)
+            rendered = time.perf_counter()
+            serialize_times.append(serialized - start)
+            render_times.append(rendered - serialized)
+
+        sizes = f"raw={len(body)}B gzip={len(gzip.compress(body))}B"
+        if brotli is not None:
+            sizes += f" br={len(brotli.compress(body, quality=4))}B"
+
+        self.stdout.write(
+            f"{name:<7} serialize={min(serialize_times) * 1000:.2f}ms "
+            f"render={min(render_times) * 1000:.2f}ms {sizes}"
+        )
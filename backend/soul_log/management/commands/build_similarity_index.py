@@ -0,0 +1,54 @@
+# backend/soul_log/management/commands/build_similarity_index.py
+
+from django.core.management.base import BaseCommand
+
+from soul_log.models import JournalEntry, ArchivedJournalEntry, EntryEmbedding
+from soul_log.similarity import embed, bump_version
+
+
+class Command(BaseCommand):
+    help = (
+        "(Re)compute similar-entry vectors for live and archived journal entries. "
+        "New and edited entries are indexed automatically; run this to backfill."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, help='Only rebuild vectors for this user id.')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Vectors written per batch.')
+
+    def handle(self, *args, **options):
+        users = set()
+        total = 0
+
+        for model in (JournalEntry, ArchivedJournalEntry):
+            entries = model.objects.order_by()
+            if options['user']:
+                entries = entries.filter(user_id=options['user'])
+
+            batch = []
+            rows = entries.values_list('id', 'user_id', 'title', 'content').iterator(chunk_size=options['chunk_size'])
+            for entry_id, user_id, title, content in rows:
+                batch.append(EntryEmbedding(
+                    entry_id=entry_id,
+                    user_id=user_id,
+                    vector=embed(f"{title}\n{content}").tobytes(),
+                ))
+                users.add(user_id)
+                if len(batch) >= options['chunk_size']:
+                    total += self._write(batch)
+                    batch = []
+            total += self._write(batch)
+
+        for user_id in users:
+            bump_version(user_id)
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} entries for {len(users)} users."))
+
+    def _write(self, batch):
+        EntryEmbedding.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=['entry_id'],
+            update_fields=['user', 'vector', 'updated_at'],
+        )
+        return len(batch)
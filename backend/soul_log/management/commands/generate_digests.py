@@ -0,0 +1,149 @@
+# backend/soul_log/management/commands/generate_digests.py
+
+import json
+from collections import Counter, defaultdict
+from datetime import date, datetime, time, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from soul_log.models import JournalEntry, GeneratedInsight, ReflectionDigest
+
+DIGEST_FIELDS = [
+    'period_end', 'entry_count', 'average_mood', 'average_sentiment', 'dominant_emotions',
+    'top_keywords', 'summary_insight_type', 'summary_title', 'summary_content',
+    'summary_scripture_reference', 'updated_at',
+]
+
+
+def previous_period(period, today):
+    """Return (start, end) dates, end inclusive, of the last complete week or month before `today`."""
+    if period == 'week':
+        start = today - timedelta(days=today.weekday() + 7)
+        return start, start + timedelta(days=6)
+    end = today.replace(day=1) - timedelta(days=1)
+    return end.replace(day=1), end
+
+
+class DigestAccumulator:
+    """Running aggregates for one user's period, fed one row at a time."""
+
+    def __init__(self):
+        self.entry_count = 0
+        self.mood_total = self.mood_count = 0
+        self.sentiment_total = self.sentiment_count = 0
+        self.emotions = Counter()
+        self.keywords = Counter()
+        self.insights = Counter()
+        self.insight_details = {}
+
+    def add_entry(self, mood_rating, sentiment_score, detected_emotions, keywords):
+        self.entry_count += 1
+        if mood_rating is not None:
+            self.mood_total += mood_rating
+            self.mood_count += 1
+        if sentiment_score is not None:
+            self.sentiment_total += sentiment_score
+            self.sentiment_count += 1
+        if detected_emotions:
+            try:
+                self.emotions.update(json.loads(detected_emotions))
+            except ValueError:
+                pass
+        if keywords:
+            self.keywords.update(keyword for keyword in keywords.split(',') if keyword)
+
+    def add_insight(self, insight_type, title, content, scripture_reference):
+        self.insights[(insight_type, title)] += 1
+        # Rows arrive oldest first, so this keeps the latest wording of each insight.
+        self.insight_details[(insight_type, title)] = (content, scripture_reference)
+
+    def to_digest(self, user_id, period, start, end):
+        summary_type, summary_title = self.insights.most_common(1)[0][0] if self.insights else ('', '')
+        summary_content, summary_reference = self.insight_details.get((summary_type, summary_title), ('', ''))
+        return ReflectionDigest(
+            user_id=user_id,
+            period=period,
+            period_start=start,
+            period_end=end,
+            entry_count=self.entry_count,
+            average_mood=round(self.mood_total / self.mood_count, 2) if self.mood_count else None,
+            average_sentiment=round(self.sentiment_total / self.sentiment_count, 3) if self.sentiment_count else None,
+            dominant_emotions=json.dumps([emotion for emotion, count in self.emotions.most_common(3)]),
+            top_keywords=','.join(keyword for keyword, count in self.keywords.most_common(7)),
+            summary_insight_type=summary_type,
+            summary_title=summary_title,
+            summary_content=summary_content,
+            summary_scripture_reference=summary_reference,
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Compute weekly and/or monthly reflection digests for the last complete period. "
+        "Safe to re-run; existing digests for the same period are updated. Intended for cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--period', choices=['week', 'month', 'all'], default='all')
+        parser.add_argument(
+            '--date', type=date.fromisoformat,
+            help='Compute the periods that ended before this date (YYYY-MM-DD). Defaults to today.',
+        )
+        parser.add_argument('--chunk-size', type=int, default=500, help='Users processed per batch.')
+
+    def handle(self, *args, **options):
+        today = options['date'] or timezone.localdate()
+        periods = ['week', 'month'] if options['period'] == 'all' else [options['period']]
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1.')
+
+        for period in periods:
+            start, end = previous_period(period, today)
+            window = (
+                timezone.make_aware(datetime.combine(start, time.min)),
+                timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min)),
+            )
+            written = self._generate(period, start, end, window, options['chunk_size'])
+            self.stdout.write(self.style.SUCCESS(f"Wrote {written} {period}ly digests for {start} to {end}."))
+
+    def _generate(self, period, start, end, window, chunk_size):
+        entries = JournalEntry.objects.filter(created_at__gte=window[0], created_at__lt=window[1])
+        user_ids = list(entries.order_by('user_id').values_list('user_id', flat=True).distinct())
+
+        written = 0
+        for offset in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[offset:offset + chunk_size]
+            accumulators = defaultdict(DigestAccumulator)
+
+            entry_rows = (
+                entries.filter(user_id__in=chunk)
+                .order_by()
+                .values_list('user_id', 'mood_rating', 'sentiment_score', 'detected_emotions', 'keywords')
+                .iterator()
+            )
+            for user_id, *row in entry_rows:
+                accumulators[user_id].add_entry(*row)
+
+            insight_rows = (
+                GeneratedInsight.objects.filter(
+                    journal_entry__user_id__in=chunk,
+                    journal_entry__created_at__gte=window[0],
+                    journal_entry__created_at__lt=window[1],
+                )
+                .order_by('created_at')
+                .values_list('journal_entry__user_id', 'insight_type', 'title', 'content', 'scripture_reference')
+                .iterator()
+            )
+            for user_id, *row in insight_rows:
+                accumulators[user_id].add_insight(*row)
+
+            ReflectionDigest.objects.bulk_create(
+                [accumulator.to_digest(user_id, period, start, end) for user_id, accumulator in accumulators.items()],
+                update_conflicts=True,
+                unique_fields=['user', 'period', 'period_start'],
+                update_fields=DIGEST_FIELDS,
+            )
+            written += len(accumulators)
+
+        return written
@@ -0,0 +1,227 @@
+# backend/soul_log/management/commands/loadtest.py
+
+import json
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+from django.conf import settings
+
+from soul_log.management.wsgi_client import call
+
+DEFAULT_MIX = 'login=5,create=10,list=30,detail=30,dashboard=25'
+PASSWORD = 'load-test-password-1'
+SAMPLE_ENTRIES = [
+    "Work was stressful today, the deadline keeps moving and I feel overwhelmed.",
+    "Had a peaceful walk in the park and felt grateful for my family.",
+    "I'm anxious about tomorrow's exam but hopeful that the preparation pays off.",
+    "Frustrated with how the meeting went, I need to set better boundaries.",
+    "A quiet, content evening. Cooked dinner and called an old friend.",
+]
+
+
+class VirtualUser:
+    def __init__(self, email, token):
+        self.email = email
+        self.token = token
+        self.entry_ids = []
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive a realistic mix of login, entry creation, list, detail and dashboard "
+        "traffic through the WSGI app at a given concurrency, against a throwaway copy "
+        "of the configured database (SQLite or PostgreSQL), and report throughput, "
+        "latency percentiles, DB queries and CPU time per endpoint."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=20, help='Users seeded through the register endpoint.')
+        parser.add_argument('--seed-entries', type=int, default=5, help='Entries created per user before the run.')
+        parser.add_argument('--concurrency', type=int, default=4, help='Worker threads issuing requests.')
+        parser.add_argument('--duration', type=float, default=30, help='Seconds of measured traffic.')
+        parser.add_argument('--mix', default=DEFAULT_MIX, help=f'Weighted request mix (default: {DEFAULT_MIX}).')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed for the traffic mix.')
+        parser.add_argument(
+            '--with-limits', action='store_true',
+            help='Keep the API throttles and analysis admission cap enabled.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            mix = {name: float(weight) for name, weight in (part.split('=') for part in options['mix'].split(','))}
+        except ValueError:
+            raise CommandError(f"Invalid --mix '{options['mix']}'; expected name=weight pairs.")
+        unknown = set(mix) - {'login', 'create', 'list', 'detail', 'dashboard'}
+        if unknown:
+            raise CommandError(f"Unknown endpoints in --mix: {', '.join(sorted(unknown))}")
+        if mix.get('detail') and options['seed_entries'] < 1:
+            raise CommandError("--seed-entries must be at least 1 when the mix includes detail requests.")
+
+        # A private in-process cache: load-test user ids start at 1 in the
+        # throwaway DB, so sharing a configured Redis would let them overwrite
+        # real users' cached profiles, dashboards and similarity versions.
+        overrides = {
+            'CACHES': {
+                'default': {
+                    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                    'LOCATION': f'soul-log-loadtest-{os.getpid()}',
+                },
+            },
+        }
+        if not options['with_limits']:
+            overrides.update({
+                'REST_FRAMEWORK': dict(settings.REST_FRAMEWORK, DEFAULT_THROTTLE_RATES={}),
+                'SOUL_LOG_ANALYSIS_MAX_IN_FLIGHT': 0,
+            })
+
+        old_name = self._create_database()
+        try:
+            with override_settings(**overrides):
+                handler = WSGIHandler()
+                users = self._seed(handler, options['users'], options['seed_entries'])
+                samples, wall, cpu = self._run(handler, users, mix, options)
+            self._report(samples, wall, cpu, options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def _create_database(self):
+        """Create and migrate a throwaway database next to the configured one."""
+        old_name = connection.settings_dict['NAME']
+        if connection.vendor == 'sqlite':
+            # A file rather than Django's default in-memory test DB, so worker
+            # threads get real connections and realistic locking.
+            fd, path = tempfile.mkstemp(prefix='soul_log_loadtest_', suffix='.sqlite3')
+            os.close(fd)
+            connection.settings_dict['TEST']['NAME'] = path
+        self.stdout.write(f"Creating load-test database ({connection.vendor})...")
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        return old_name
+
+    def _seed(self, handler, user_count, entries_per_user):
+        self.stdout.write(f"Seeding {user_count} users with {entries_per_user} entries each...")
+        users = []
+        for i in range(user_count):
+            email = f'loadtest{i}@example.com'
+            status_code, body = call(handler, 'POST', '/api/auth/register/', data={
+                'username': f'loadtest{i}', 'email': email, 'password': PASSWORD,
+            })
+            if status_code != 201:
+                raise CommandError(f"Registering a seed user failed ({status_code}): {body[:200]!r}")
+            user = VirtualUser(email, json.loads(body)['token'])
+            for j in range(entries_per_user):
+                status_code, body = call(handler, 'POST', '/api/entries/', user.token, {
+                    'content': SAMPLE_ENTRIES[(i + j) % len(SAMPLE_ENTRIES)], 'mood_rating': j % 5 + 1,
+                })
+                if status_code != 201:
+                    raise CommandError(f"Seeding an entry failed ({status_code}): {body[:200]!r}")
+                user.entry_ids.append(json.loads(body)['id'])
+            users.append(user)
+        connection.close()
+        return users
+
+    def _run(self, handler, users, mix, options):
+        names, weights = list(mix), list(mix.values())
+        samples = defaultdict(list)  # endpoint -> [(status, latency, queries, cpu)]
+        failures = []
+        lock = threading.Lock()
+        deadline = time.perf_counter() + options['duration']
+
+        def worker(worker_id):
+            rng = random.Random(options['seed'] + worker_id)
+            queries = [0]
+
+            def count_queries(execute, sql, params, many, context):
+                queries[0] += 1
+                return execute(sql, params, many, context)
+
+            local = []
+            try:
+                with connection.execute_wrapper(count_queries):
+                    while time.perf_counter() < deadline:
+                        user = rng.choice(users)
+                        name = rng.choices(names, weights)[0]
+                        queries[0] = 0
+                        cpu_start, start = time.thread_time(), time.perf_counter()
+                        status_code, body = self._request(handler, name, user, rng)
+                        local.append((name, status_code, time.perf_counter() - start,
+                                      queries[0], time.thread_time() - cpu_start))
+                        if name == 'create' and status_code == 201:
+                            user.entry_ids.append(json.loads(body)['id'])
+            except Exception as exc:
+                # Surface it after join() instead of silently losing a worker.
+                failures.append(exc)
+            finally:
+                connection.close()
+            with lock:
+                for name, *sample in local:
+                    samples[name].append(sample)
+
+        self.stdout.write(
+            f"Running {options['concurrency']} workers for {options['duration']:.0f}s "
+            f"against {len(users)} users..."
+        )
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(options['concurrency'])]
+        cpu_start, start = time.process_time(), time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if failures:
+            raise CommandError(f"{len(failures)} load-test worker(s) crashed: {failures[0]!r}") from failures[0]
+        return samples, time.perf_counter() - start, time.process_time() - cpu_start
+
+    def _request(self, handler, name, user, rng):
+        if name == 'login':
+            return call(handler, 'POST', '/api/auth/login/', data={'email': user.email, 'password': PASSWORD})
+        if name == 'create':
+            return call(handler, 'POST', '/api/entries/', user.token, {
+                'content': rng.choice(SAMPLE_ENTRIES), 'mood_rating': rng.randint(1, 5),
+            })
+        if name == 'list':
+            return call(handler, 'GET', '/api/entries/', user.token)
+        if name == 'detail':
+            return call(handler, 'GET', f'/api/entries/{rng.choice(user.entry_ids)}/', user.token)
+        return call(handler, 'GET', '/api/dashboard/', user.token)
+
+    def _report(self, samples, wall, cpu, options):
+        total = sum(len(endpoint_samples) for endpoint_samples in samples.values())
+        self.stdout.write(
+            f"\n{total} requests in {wall:.1f}s = {total / wall:.1f} req/s at concurrency "
+            f"{options['concurrency']}; process CPU {cpu:.1f}s ({cpu / wall:.0%} of one core)\n"
+        )
+        self.stdout.write(
+            f"{'endpoint':<10} {'count':>6} {'errors':>6} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} "
+            f"{'p99 ms':>8} {'queries':>8} {'cpu ms':>8}"
+        )
+        for name in sorted(samples):
+            rows = samples[name]
+            latencies = sorted(row[1] * 1000 for row in rows)
+            errors = sum(1 for row in rows if row[0] >= 400)
+            self.stdout.write(
+                f"{name:<10} {len(rows):>6} {errors:>6} {len(rows) / wall:>7.1f} "
+                f"{self._percentile(latencies, 50):>8.1f} {self._percentile(latencies, 95):>8.1f} "
+                f"{self._percentile(latencies, 99):>8.1f} "
+                f"{statistics.mean(row[2] for row in rows):>8.1f} "
+                f"{statistics.mean(row[3] for row in rows) * 1000:>8.1f}"
+            )
+
+        failures = Counter(
+            f"{name} {row[0]}" for name, rows in samples.items() for row in rows if row[0] >= 400
+        )
+        if failures:
+            self.stdout.write(self.style.WARNING(
+                'Errors by status: ' + ', '.join(f'{key} x{count}' for key, count in sorted(failures.items()))
+            ))
+
+    def _percentile(self, sorted_values, percent):
+        index = min(len(sorted_values) - 1, round(percent / 100 * (len(sorted_values) - 1)))
+        return sorted_values[index]
@@ -0,0 +1,35 @@
+# backend/soul_log/management/wsgi_client.py
+
+import json
+from io import BytesIO
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+
+
+def call(handler, method, path, token=None, data=None):
+    """
+    Send one request straight through a WSGIHandler and return (status_code, body).
+
+    Unlike the test client, this fires request_started/request_finished, so
+    database connections are opened and closed exactly as under gunicorn.
+    """
+    body = json.dumps(data).encode() if data is not None else b''
+    environ = {
+        'PATH_INFO': path,
+        'REQUEST_METHOD': method,
+        'HTTP_HOST': settings.ALLOWED_HOSTS[0].lstrip('.'),
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.input': BytesIO(body),
+    }
+    if token:
+        environ['HTTP_AUTHORIZATION'] = f'Token {token}'
+    setup_testing_defaults(environ)
+
+    response = handler(environ, lambda status, headers: None)
+    try:
+        content = b''.join(response)
+    finally:
+        response.close()
+    return response.status_code, content
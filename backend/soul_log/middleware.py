@@ -0,0 +1,50 @@
+# backend/soul_log/middleware.py
+
+import re
+
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; fall back to gzip only.
+    brotli = None
+
+re_accepts_brotli = re.compile(r'\bbr\b')
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Compress responses with Brotli when the client accepts it and the
+    `brotli` package is installed, otherwise with gzip.
+
+    Streaming responses are always left to GZipMiddleware.
+    """
+    brotli_quality = 4  # Close to gzip's CPU cost with noticeably smaller output.
+
+    def process_response(self, request, response):
+        if (
+            brotli is None
+            or response.streaming
+            or response.has_header('Content-Encoding')
+            or len(response.content) < 200
+            or not re_accepts_brotli.search(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        ):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        compressed_content = brotli.compress(response.content, quality=self.brotli_quality)
+        if len(compressed_content) >= len(response.content):
+            return response
+
+        response.content = compressed_content
+        response.headers['Content-Length'] = str(len(response.content))
+
+        # Same as GZipMiddleware: the body changed, so a strong ETag no longer holds.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = 'br'
+
+        return response
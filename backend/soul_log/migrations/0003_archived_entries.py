@@ -0,0 +1,52 @@
+# Generated by Django 5.2.6 on 2026-10-19 16:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('soul_log', '0002_journal_entry_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedJournalEntry',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(blank=True, max_length=200)),
+                ('content', models.TextField()),
+                ('mood_rating', models.IntegerField(blank=True, choices=[(1, 'Very Sad'), (2, 'Sad'), (3, 'Neutral'), (4, 'Happy'), (5, 'Very Happy')], null=True)),
+                ('emotions', models.CharField(blank=True, max_length=500)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('sentiment_score', models.FloatField(blank=True, null=True)),
+                ('detected_emotions', models.TextField(blank=True)),
+                ('keywords', models.TextField(blank=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedInsight',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('insight_type', models.CharField(choices=[('psychological', 'Psychological'), ('biblical', 'Biblical'), ('islamic', 'Islamic')], max_length=20)),
+                ('title', models.CharField(max_length=200)),
+                ('content', models.TextField()),
+                ('scripture_reference', models.CharField(blank=True, max_length=200)),
+                ('created_at', models.DateTimeField()),
+                ('journal_entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='insights', to='soul_log.archivedjournalentry')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='archivedjournalentry',
+            index=models.Index(fields=['user', '-created_at'], name='archived_entry_user_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('soul_log', '0004_entry_embeddings'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReflectionDigest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('week', 'Weekly'), ('month', 'Monthly')], max_length=10)),
+                ('period_start', models.DateField()),
+                ('period_end', models.DateField()),
+                ('entry_count', models.IntegerField(default=0)),
+                ('average_mood', models.FloatField(blank=True, null=True)),
+                ('average_sentiment', models.FloatField(blank=True, null=True)),
+                ('dominant_emotions', models.TextField(blank=True)),
+                ('top_keywords', models.TextField(blank=True)),
+                ('summary_insight_type', models.CharField(blank=True, choices=[('psychological', 'Psychological'), ('biblical', 'Biblical'), ('islamic', 'Islamic')], max_length=20)),
+                ('summary_title', models.CharField(blank=True, max_length=200)),
+                ('summary_content', models.TextField(blank=True)),
+                ('summary_scripture_reference', models.CharField(blank=True, max_length=200)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-period_start'],
+                'unique_together': {('user', 'period', 'period_start')},
+            },
+        ),
+    ]
@@ -30,6 +30,7 @@ class JournalEntry(models.Model):
     emotions = models.CharField(max_length=500, blank=True)  # Comma-separated emotions
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    version = models.PositiveIntegerField(default=1)  # Bumped on every update; served as the ETag
     
     # AI Analysis fields
     sentiment_score = models.FloatField(null=True, blank=True)  # -1 to 1
@@ -38,6 +39,11 @@ class JournalEntry(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Per-user timelines and the admin's date filters/ordering
+            models.Index(fields=['user', '-created_at'], name='entry_user_created_idx'),
+            models.Index(fields=['-created_at'], name='entry_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.created_at.strftime('%Y-%m-%d')}"
@@ -85,4 +91,117 @@ class GeneratedInsight(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     def __str__(self):
-        return f"{self.insight_type} insight for {self.journal_entry}"
\ No newline at end of file
+        return f"{self.insight_type} insight for {self.journal_entry}"
+
+class ArchivedJournalEntry(models.Model):
+    """Journal entry moved out of the hot table by `manage.py archive_entries`."""
+    id = models.BigIntegerField(primary_key=True)  # Keeps the original JournalEntry id
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    title = models.CharField(max_length=200, blank=True)
+    content = models.TextField()
+    mood_rating = models.IntegerField(choices=JournalEntry.MOOD_CHOICES, null=True, blank=True)
+    emotions = models.CharField(max_length=500, blank=True)
+    # Copied from the original entry, so no auto_now/auto_now_add here
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    version = models.PositiveIntegerField(default=1)
+    sentiment_score = models.FloatField(null=True, blank=True)
+    detected_emotions = models.TextField(blank=True)
+    keywords = models.TextField(blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at'], name='archived_entry_user_idx'),
+        ]
+    
+    __str__ = JournalEntry.__str__
+    get_emotions_list = JournalEntry.get_emotions_list
+    get_detected_emotions = JournalEntry.get_detected_emotions
+
+class ArchivedInsight(models.Model):
+    id = models.BigIntegerField(primary_key=True)  # Keeps the original GeneratedInsight id
+    journal_entry = models.ForeignKey(ArchivedJournalEntry, on_delete=models.CASCADE, related_name='insights')
+    insight_type = models.CharField(max_length=20, choices=InsightTemplate.INSIGHT_TYPES)
+    title = models.CharField(max_length=200)
+    content = models.TextField()
+    scripture_reference = models.CharField(max_length=200, blank=True)
+    created_at = models.DateTimeField()
+    
+    def __str__(self):
+        return f"{self.insight_type} insight for {self.journal_entry}"
+
+class EntryEmbedding(models.Model):
+    """
+    Hashed term-frequency vector for one journal entry (see similarity.py).
+
+    Keyed by entry id rather than a foreign key so vectors survive archiving
+    and "similar entries" can still point at archived ones.
+    """
+    entry_id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    vector = models.BinaryField()  # float32 array, similarity.DIMENSIONS long
+    updated_at = models.DateTimeField(auto_now=True)
+
+class ReflectionDigest(models.Model):
+    """Weekly or monthly summary of a user's entries, written by `manage.py generate_digests`."""
+    PERIOD_CHOICES = [
+        ('week', 'Weekly'),
+        ('month', 'Monthly'),
+    ]
+    
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    period = models.CharField(max_length=10, choices=PERIOD_CHOICES)
+    period_start = models.DateField()
+    period_end = models.DateField()  # Inclusive
+    entry_count = models.IntegerField(default=0)
+    average_mood = models.FloatField(null=True, blank=True)
+    average_sentiment = models.FloatField(null=True, blank=True)
+    dominant_emotions = models.TextField(blank=True)  # JSON string
+    top_keywords = models.TextField(blank=True)  # Comma-separated keywords
+    
+    # Most frequent insight of the period
+    summary_insight_type = models.CharField(max_length=20, choices=InsightTemplate.INSIGHT_TYPES, blank=True)
+    summary_title = models.CharField(max_length=200, blank=True)
+    summary_content = models.TextField(blank=True)
+    summary_scripture_reference = models.CharField(max_length=200, blank=True)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['-period_start']
+        unique_together = ['user', 'period', 'period_start']
+    
+    def __str__(self):
+        return f"{self.user.username} - {self.period} of {self.period_start}"
+    
+    def get_dominant_emotions(self):
+        if self.dominant_emotions:
+            try:
+                return json.loads(self.dominant_emotions)
+            except ValueError:
+                return []
+        return []
+    
+    def get_top_keywords(self):
+        if self.top_keywords:
+            return self.top_keywords.split(',')
+        return []
+
+
+class IdempotencyKey(models.Model):
+    """Response stored for an `Idempotency-Key` on entry creation, replayed on retries."""
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    key = models.CharField(max_length=255)
+    request_hash = models.CharField(max_length=64)  # SHA-256 of the request body
+    response_status = models.IntegerField(null=True, blank=True)  # Null while the first request is running
+    response_body = models.TextField(blank=True)  # JSON string
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        unique_together = ['user', 'key']
+        indexes = [
+            models.Index(fields=['created_at'], name='idempotency_created_idx'),
+        ]
@@ -0,0 +1,26 @@
+# backend/soul_log/renderers.py
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer backed by orjson.
+
+    Types orjson doesn't know about (lazy translation strings, Decimals, ...)
+    fall back to DRF's JSONEncoder so error responses render exactly as before.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        # orjson only supports two-space indentation, so any requested indent maps to it.
+        option = orjson.OPT_INDENT_2 if self.get_indent(accepted_media_type, renderer_context) else 0
+
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=option)
+
+        # Match JSONRenderer, which escapes these so the output is a strict javascript subset.
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
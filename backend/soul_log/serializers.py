@@ -2,7 +2,11 @@
 
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from .models import UserProfile, JournalEntry, InsightTemplate, GeneratedInsight
+from django.utils import timezone
+from .models import (
+    UserProfile, JournalEntry, InsightTemplate, GeneratedInsight, ArchivedJournalEntry, ArchivedInsight,
+    ReflectionDigest,
+)
 
 # --- I ADDED THIS CLASS ---
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -37,10 +41,10 @@ class JournalEntrySerializer(serializers.ModelSerializer):
         model = JournalEntry
         fields = [
             'id', 'user', 'title', 'content', 'mood_rating', 'emotions', 
-            'created_at', 'updated_at', 'sentiment_score', 'detected_emotions',
+            'created_at', 'updated_at', 'version', 'sentiment_score', 'detected_emotions',
             'keywords', 'emotions_list', 'detected_emotions_data'
         ]
-        read_only_fields = ['user', 'sentiment_score', 'detected_emotions', 'keywords']
+        read_only_fields = ['user', 'version', 'sentiment_score', 'detected_emotions', 'keywords']
     
     def get_emotions_list(self, obj):
         return obj.get_emotions_list()
@@ -58,3 +62,93 @@ class JournalEntryWithInsightsSerializer(JournalEntrySerializer):
     
     class Meta(JournalEntrySerializer.Meta):
         fields = JournalEntrySerializer.Meta.fields + ['insights']
+
+class ReflectionDigestSerializer(serializers.ModelSerializer):
+    dominant_emotions = serializers.SerializerMethodField()
+    top_keywords = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = ReflectionDigest
+        fields = [
+            'period', 'period_start', 'period_end', 'entry_count', 'average_mood',
+            'average_sentiment', 'dominant_emotions', 'top_keywords', 'summary_insight_type',
+            'summary_title', 'summary_content', 'summary_scripture_reference', 'updated_at',
+        ]
+    
+    def get_dominant_emotions(self, obj):
+        return obj.get_dominant_emotions()
+    
+    def get_top_keywords(self, obj):
+        return obj.get_top_keywords()
+
+class ArchivedInsightSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ArchivedInsight
+        fields = GeneratedInsightSerializer.Meta.fields
+
+class ArchivedJournalEntrySerializer(JournalEntryWithInsightsSerializer):
+    """Same shape as a live entry; archived entries are read-only."""
+    insights = ArchivedInsightSerializer(many=True, read_only=True)
+    
+    class Meta(JournalEntryWithInsightsSerializer.Meta):
+        model = ArchivedJournalEntry
+        read_only_fields = JournalEntryWithInsightsSerializer.Meta.fields
+
+def _datetime(value):
+    """Format a datetime the same way DRF's DateTimeField does by default."""
+    if value is None:
+        return None
+    value = timezone.localtime(value).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+class JournalEntryListSerializer(serializers.BaseSerializer):
+    """
+    Read-only serializer for entry lists.
+
+    Builds each dict by hand instead of going through ModelSerializer field
+    introspection, omits the nested `user` (always the requester) and sends the
+    parsed `emotions_list`/`detected_emotions_data` without their raw string
+    copies. Expects `insights` to be prefetched. Works for archived entries too.
+    """
+
+    def to_representation(self, instance):
+        return {
+            'id': instance.id,
+            'title': instance.title,
+            'content': instance.content,
+            'mood_rating': instance.mood_rating,
+            'created_at': _datetime(instance.created_at),
+            'updated_at': _datetime(instance.updated_at),
+            'version': instance.version,
+            'sentiment_score': instance.sentiment_score,
+            'keywords': instance.keywords,
+            'emotions_list': instance.get_emotions_list(),
+            'detected_emotions_data': instance.get_detected_emotions(),
+            'insights': [
+                {
+                    'id': insight.id,
+                    'insight_type': insight.insight_type,
+                    'title': insight.title,
+                    'content': insight.content,
+                    'scripture_reference': insight.scripture_reference,
+                    'created_at': _datetime(insight.created_at),
+                }
+                for insight in instance.insights.all()
+            ],
+        }
+
+
+class SimilarEntrySerializer(serializers.BaseSerializer):
+    """Compact entry summary for similar-entry results; expects a `similarity` attribute."""
+
+    def to_representation(self, instance):
+        return {
+            'id': instance.id,
+            'title': instance.title,
+            'created_at': _datetime(instance.created_at),
+            'mood_rating': instance.mood_rating,
+            'detected_emotions_data': instance.get_detected_emotions(),
+            'similarity': instance.similarity,
+        }
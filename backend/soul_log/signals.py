@@ -0,0 +1,46 @@
+# backend/soul_log/signals.py
+
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .cache import invalidate_profile, invalidate_dashboard
+from .models import UserProfile, JournalEntry, GeneratedInsight, ArchivedJournalEntry
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_profile(sender, instance, **kwargs):
+    # The cached profile embeds the user's name and email.
+    invalidate_profile(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=UserProfile)
+def invalidate_profile_cache(sender, instance, **kwargs):
+    invalidate_profile(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=JournalEntry)
+def invalidate_entry_dashboard(sender, instance, **kwargs):
+    invalidate_dashboard(instance.user_id)
+
+
+@receiver(post_delete, sender=ArchivedJournalEntry)
+def invalidate_archived_entry_dashboard(sender, instance, **kwargs):
+    # Dashboard stats include archived entries.
+    invalidate_dashboard(instance.user_id)
+
+
+@receiver(post_save, sender=GeneratedInsight)
+def invalidate_insight_dashboard(sender, instance, **kwargs):
+    invalidate_dashboard(instance.journal_entry.user_id)
+
+
+@receiver(post_delete, sender=GeneratedInsight)
+def invalidate_deleted_insight_dashboard(sender, instance, origin=None, **kwargs):
+    # When the delete cascades from an entry, the entry's own receiver already
+    # covers it, so skip the extra query for the owning entry.
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model is JournalEntry:
+        return
+    invalidate_dashboard(instance.journal_entry.user_id)
@@ -0,0 +1,185 @@
+# backend/soul_log/similarity.py
+
+import re
+import zlib
+from functools import cached_property
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache as shared_cache
+
+from .cache import LocalLRUCache
+from .models import EntryEmbedding
+
+DIMENSIONS = 256
+TOKEN_RE = re.compile(r'\b[a-z][a-z\']{2,}\b')
+STOP_WORDS = frozenset({
+    'the', 'and', 'but', 'for', 'with', 'was', 'were', 'been', 'have', 'has', 'had',
+    'will', 'would', 'could', 'should', 'that', 'this', 'these', 'those', 'there',
+    'then', 'than', 'they', 'them', 'their', 'what', 'when', 'where', 'which', 'who',
+    'you', 'your', 'are', 'not', 'just', 'about', 'from', 'into', 'out', 'all', 'its',
+    'it\'s', 'i\'m', 'our', 'his', 'her', 'she', 'him', 'did', 'does', 'can', 'because',
+})
+VERSION_KEY = 'soul_log:similarity:version:%s'
+CHANGE_KEY = 'soul_log:similarity:change:%s:%s'
+# A worker this many versions behind reloads from the DB instead of replaying changes
+MAX_REPLAYED_CHANGES = 64
+
+# user_id -> (version, UserIndex); a stale version is caught up from the
+# published changes, or reloaded from the DB when they are not all available
+_indexes = LocalLRUCache(
+    max_entries=settings.SOUL_LOG_SIMILARITY_CACHED_USERS,
+    ttl=settings.SOUL_LOG_CACHE['SHARED_TTL'],
+)
+
+
+def embed(text):
+    """
+    Return a float32 vector of log-scaled hashed term frequencies.
+
+    Terms are hashed with crc32 (stable across processes) into DIMENSIONS
+    buckets with a hash-derived sign so collisions tend to cancel out. IDF
+    weighting is applied per user at query time, so stored vectors never
+    need recomputing as a user's vocabulary changes.
+    """
+    vector = np.zeros(DIMENSIONS, dtype=np.float32)
+    for token in TOKEN_RE.findall(text.lower()):
+        if token in STOP_WORDS:
+            continue
+        digest = zlib.crc32(token.encode())
+        vector[digest % DIMENSIONS] += 1.0 if digest & 0x80000000 else -1.0
+    return np.sign(vector) * np.log1p(np.abs(vector))
+
+
+def entry_text(entry):
+    return f"{entry.title}\n{entry.content}"
+
+
+def update_entry_embedding(entry):
+    """Store or refresh the vector for a journal entry."""
+    vector = embed(entry_text(entry))
+    EntryEmbedding.objects.update_or_create(
+        entry_id=entry.pk,
+        defaults={'user_id': entry.user_id, 'vector': vector.tobytes()},
+    )
+    publish_change(entry.user_id, entry.pk, vector)
+
+
+def delete_entry_embedding(entry):
+    EntryEmbedding.objects.filter(entry_id=entry.pk).delete()
+    publish_change(entry.user_id, entry.pk, None)
+
+
+def publish_change(user_id, entry_id, vector):
+    """
+    Bump the user's index version and record the single-row change under it.
+
+    Workers holding an older copy of the index replay these records instead
+    of reloading every vector the user has. `vector` is None for a removal.
+    """
+    version = bump_version(user_id)
+    shared_cache.set(
+        CHANGE_KEY % (user_id, version),
+        (entry_id, None if vector is None else vector.tobytes()),
+        settings.SOUL_LOG_CACHE['SHARED_TTL'],
+    )
+
+
+def bump_version(user_id):
+    """Increment and return the user's index version."""
+    key = VERSION_KEY % user_id
+    shared_cache.add(key, 0, timeout=None)
+    try:
+        return shared_cache.incr(key)
+    except ValueError:
+        shared_cache.set(key, 1, timeout=None)
+        return 1
+
+
+class UserIndex:
+    """All of one user's entry vectors as a single contiguous float32 matrix."""
+
+    def __init__(self, entry_ids, vectors):
+        self.entry_ids = entry_ids
+        self.vectors = vectors
+        self.positions = {entry_id: i for i, entry_id in enumerate(entry_ids.tolist())}
+
+    @classmethod
+    def load(cls, user_id):
+        rows = EntryEmbedding.objects.filter(user_id=user_id).values_list('entry_id', 'vector')
+        entry_ids, blobs = zip(*rows) if rows else ((), ())
+        vectors = np.frombuffer(b''.join(blobs), dtype=np.float32).reshape(len(blobs), DIMENSIONS)
+        return cls(np.array(entry_ids, dtype=np.int64), vectors)
+
+    def apply(self, changes):
+        """
+        Return a new index with `changes` ({entry_id: vector or None}) applied.
+
+        The current index is left untouched, so threads still reading it are safe.
+        """
+        keep = ~np.isin(self.entry_ids, np.fromiter(changes, dtype=np.int64, count=len(changes)))
+        added = {entry_id: vector for entry_id, vector in changes.items() if vector is not None}
+        entry_ids = np.concatenate([self.entry_ids[keep], np.array(list(added), dtype=np.int64)])
+        vectors = np.concatenate([
+            self.vectors[keep],
+            np.array(list(added.values()), dtype=np.float32).reshape(len(added), DIMENSIONS),
+        ])
+        return UserIndex(entry_ids, vectors)
+
+    @cached_property
+    def weighted(self):
+        """IDF-weighted, L2-normalized rows, computed once per loaded index."""
+        doc_freq = np.count_nonzero(self.vectors, axis=0)
+        idf = np.log((1 + len(self.vectors)) / (1 + doc_freq)).astype(np.float32) + 1
+        weighted = self.vectors * idf
+        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+        return weighted / np.maximum(norms, 1e-12)
+
+    def most_similar(self, entry_id, k):
+        """Return up to `k` (entry_id, score) pairs, best first, excluding `entry_id`."""
+        position = self.positions.get(entry_id)
+        if position is None or len(self.entry_ids) < 2:
+            return []
+
+        scores = self.weighted @ self.weighted[position]
+        scores[position] = -np.inf
+
+        k = min(k, len(scores) - 1)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (int(self.entry_ids[i]), round(float(scores[i]), 4))
+            for i in top if scores[i] > 0
+        ]
+
+
+def get_user_index(user_id):
+    version = shared_cache.get(VERSION_KEY % user_id, 0)
+    cached = _indexes.get(user_id)
+    if cached is not None:
+        cached_version, index = cached
+        if cached_version == version:
+            return index
+        if cached_version < version <= cached_version + MAX_REPLAYED_CHANGES:
+            index = _replay_changes(user_id, index, cached_version, version)
+            if index is not None:
+                _indexes.set(user_id, (version, index))
+                return index
+
+    index = UserIndex.load(user_id)
+    _indexes.set(user_id, (version, index))
+    return index
+
+
+def _replay_changes(user_id, index, from_version, to_version):
+    """Apply the changes after `from_version` up to `to_version`, or return None if any expired."""
+    keys = [CHANGE_KEY % (user_id, version) for version in range(from_version + 1, to_version + 1)]
+    records = shared_cache.get_many(keys)
+    if len(records) < len(keys):
+        return None
+
+    changes = {}
+    for key in keys:
+        entry_id, vector = records[key]
+        changes[entry_id] = None if vector is None else np.frombuffer(vector, dtype=np.float32)
+    return index.apply(changes)
@@ -1,3 +1,120 @@
-from django.test import TestCase
+# backend/soul_log/tests.py
 
-# Create your tests here.
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import F
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from .models import JournalEntry
+from .views import JournalEntryDetailView
+
+LOGIN_ONLY_RATES = dict(
+    settings.REST_FRAMEWORK,
+    DEFAULT_THROTTLE_RATES={'login': '3/min'},
+)
+
+
+@override_settings(REST_FRAMEWORK=LOGIN_ONLY_RATES)
+class TokenBucketThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.now = 1000.0
+        patcher = mock.patch('soul_log.throttling.TokenBucketThrottle.timer', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def login(self):
+        return self.client.post('/api/auth/login/', {'email': 'a@example.com', 'password': 'wrong'}, format='json')
+
+    def test_allows_capacity_then_throttles_with_retry_after(self):
+        for _ in range(3):
+            self.assertEqual(self.login().status_code, 401)
+
+        response = self.login()
+        self.assertEqual(response.status_code, 429)
+        # 3/min refills one token every 20 seconds.
+        self.assertEqual(response['Retry-After'], '20')
+
+    def test_refills_at_configured_rate(self):
+        for _ in range(3):
+            self.login()
+        self.assertEqual(self.login().status_code, 429)
+
+        self.now += 19
+        self.assertEqual(self.login().status_code, 429)
+        self.now += 1
+        self.assertEqual(self.login().status_code, 401)
+        self.assertEqual(self.login().status_code, 429)
+
+        # A full period refills the bucket, but never beyond its capacity.
+        self.now += 600
+        for _ in range(3):
+            self.assertEqual(self.login().status_code, 401)
+        self.assertEqual(self.login().status_code, 429)
+
+
+@mock.patch('soul_log.views.AIInsightService.analyze_journal_entry', return_value=None)
+class EntryIdempotencyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('writer', 'writer@example.com', 'pw-12345678')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + Token.objects.create(user=self.user).key)
+        # Let unexpected server errors come back as 500 responses, as they would in production.
+        self.client.raise_request_exception = False
+
+    def create(self, content, key='key-1'):
+        return self.client.post('/api/entries/', {'content': content}, format='json', HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_retry_replays_the_first_response(self, analyze):
+        first = self.create('A calm day.')
+        retry = self.create('A calm day.')
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(retry.json()['id'], first.json()['id'])
+        self.assertEqual(JournalEntry.objects.count(), 1)
+        self.assertEqual(analyze.call_count, 1)
+
+    def test_reusing_a_key_with_a_different_body_is_rejected(self, analyze):
+        self.create('A calm day.')
+
+        self.assertEqual(self.create('A busy day.').status_code, 422)
+        self.assertEqual(JournalEntry.objects.count(), 1)
+
+    def test_failed_create_is_rolled_back_so_the_retry_creates_one_entry(self, analyze):
+        with mock.patch('soul_log.similarity.update_entry_embedding', side_effect=RuntimeError('boom')):
+            self.assertEqual(self.create('A calm day.').status_code, 500)
+        self.assertFalse(JournalEntry.objects.exists())
+
+        self.assertEqual(self.create('A calm day.').status_code, 201)
+        self.assertEqual(JournalEntry.objects.count(), 1)
+
+    def test_stale_if_match_returns_412(self, analyze):
+        entry = JournalEntry.objects.create(user=self.user, content='Draft')
+        self.client.patch(f'/api/entries/{entry.pk}/', {'content': 'Edit 1'}, format='json', HTTP_IF_MATCH='"1"')
+
+        response = self.client.patch(f'/api/entries/{entry.pk}/', {'content': 'Edit 2'}, format='json', HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, 412)
+        entry.refresh_from_db()
+        self.assertEqual((entry.content, entry.version), ('Edit 1', 2))
+
+    def test_lost_race_without_if_match_returns_409(self, analyze):
+        entry = JournalEntry.objects.create(user=self.user, content='Draft')
+        get_object = JournalEntryDetailView.get_object
+
+        def get_object_then_concurrent_edit(view):
+            instance = get_object(view)
+            JournalEntry.objects.filter(pk=instance.pk).update(version=F('version') + 1)
+            return instance
+
+        with mock.patch.object(JournalEntryDetailView, 'get_object', get_object_then_concurrent_edit):
+            response = self.client.patch(f'/api/entries/{entry.pk}/', {'content': 'Edit'}, format='json')
+        self.assertEqual(response.status_code, 409)
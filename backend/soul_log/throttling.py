@@ -0,0 +1,226 @@
+# backend/soul_log/throttling.py
+
+import hashlib
+import random
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache as default_cache
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+SHED_KEY_PREFIX = 'soul_log:shed:'
+SLOT_KEY_FORMAT = 'soul_log:analysis:slot:%d'
+
+
+def record_shed(scope):
+    """Count a request rejected by a throttle or the analysis admission cap."""
+    key = SHED_KEY_PREFIX + scope
+    default_cache.add(key, 0, timeout=None)
+    try:
+        default_cache.incr(key)
+    except ValueError:
+        # The key was evicted between add() and incr(); start counting again.
+        default_cache.set(key, 1, timeout=None)
+
+
+def shed_counts():
+    """Return the number of shed requests per scope."""
+    scopes = list(api_settings.DEFAULT_THROTTLE_RATES) + ['analysis']
+    counts = default_cache.get_many([SHED_KEY_PREFIX + scope for scope in scopes])
+    return {scope: counts.get(SHED_KEY_PREFIX + scope, 0) for scope in scopes}
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token bucket throttle backed by Django's cache framework.
+
+    The rate for ``scope`` is read from ``DEFAULT_THROTTLE_RATES`` using DRF's
+    ``'<requests>/<period>'`` format: the request count is the bucket capacity
+    and the bucket refills at ``requests / period`` tokens per second, so short
+    bursts are allowed while the sustained rate stays bounded.
+
+    Each read-modify-write of a bucket holds a short lock taken with
+    ``cache.add()``, which is atomic on every Django backend, so concurrent
+    requests cannot all spend the same token. A request that cannot get the
+    lock after ``lock_attempts`` quick polls is itself part of a burst and is
+    shed straight away rather than tying up the worker.
+    """
+    cache = default_cache
+    cache_format = 'soul_log:throttle:%(scope)s:%(ident)s'
+    scope = None
+    timer = time.time
+    lock_timeout = 1
+    lock_attempts = 3
+    lock_poll = 0.001
+
+    def __init__(self):
+        self.capacity, self.refill_rate = self.parse_rate(self.get_rate())
+        self.wait_seconds = None
+
+    def get_rate(self):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def parse_rate(self, rate):
+        if not rate:
+            return None, None
+        num, period = rate.split('/')
+        num_requests = int(num)
+        duration = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}[period[0]]
+        return num_requests, num_requests / duration
+
+    def get_cache_key(self, request, view):
+        """Return the bucket key for this request, or None to skip throttling."""
+        raise NotImplementedError('.get_cache_key() must be overridden')
+
+    def allow_request(self, request, view):
+        if self.capacity is None:
+            return True
+
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+
+        lock_key = key + ':lock'
+        if not self._acquire(lock_key):
+            self.wait_seconds = 1 / self.refill_rate
+            record_shed(self.scope)
+            return False
+        try:
+            return self._take_token(key)
+        finally:
+            self.cache.delete(lock_key)
+
+    def _acquire(self, lock_key):
+        for attempt in range(self.lock_attempts):
+            if attempt:
+                time.sleep(self.lock_poll)
+            if self.cache.add(lock_key, 1, self.lock_timeout):
+                return True
+        return False
+
+    def _take_token(self, key):
+        now = self.timer()
+        tokens, last = self.cache.get(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - last) * self.refill_rate)
+        # Keep the bucket around long enough to refill completely.
+        timeout = int(self.capacity / self.refill_rate) + 1
+
+        if tokens < 1:
+            self.cache.set(key, (tokens, now), timeout)
+            self.wait_seconds = (1 - tokens) / self.refill_rate
+            record_shed(self.scope)
+            return False
+
+        self.cache.set(key, (tokens - 1, now), timeout)
+        return True
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    """Per-user bucket shared by every endpoint an authenticated user calls."""
+    scope = 'user'
+
+    def get_cache_key(self, request, view):
+        if not request.user or not request.user.is_authenticated:
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': request.user.pk}
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    """Per-client-IP bucket, applied to anonymous and authenticated traffic."""
+    scope = 'ip'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {'scope': self.scope, 'ident': self.get_ident(request)}
+
+
+class EndpointTokenBucketThrottle(TokenBucketThrottle):
+    """Per-endpoint bucket keyed by user when authenticated, otherwise by IP."""
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = 'user-%s' % request.user.pk
+        else:
+            ident = 'ip-%s' % self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+
+class LoginThrottle(EndpointTokenBucketThrottle):
+    scope = 'login'
+
+
+class LoginAccountThrottle(TokenBucketThrottle):
+    """Per-account bucket on login, keyed by the normalised email being tried."""
+    scope = 'login_account'
+
+    def get_cache_key(self, request, view):
+        email = request.data.get('email')
+        if not isinstance(email, str) or not email.strip():
+            return None
+        # Hash so arbitrary client input never ends up in a cache key.
+        ident = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+
+class RegisterThrottle(EndpointTokenBucketThrottle):
+    scope = 'register'
+
+
+class EntryCreateThrottle(EndpointTokenBucketThrottle):
+    scope = 'entry_create'
+
+
+class AnalysisCapacityExceeded(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Entry analysis is at capacity, please retry shortly.'
+    default_code = 'analysis_capacity_exceeded'
+
+    def __init__(self, wait, detail=None, code=None):
+        super().__init__(detail, code)
+        # DRF's exception handler turns `wait` into a Retry-After header.
+        self.wait = wait
+
+
+def _slot_keys():
+    return [SLOT_KEY_FORMAT % slot for slot in range(settings.SOUL_LOG_ANALYSIS_MAX_IN_FLIGHT)]
+
+
+def analysis_in_flight():
+    """Return the number of analysis jobs currently running across workers."""
+    return len(default_cache.get_many(_slot_keys()))
+
+
+@contextmanager
+def analysis_slot():
+    """
+    Hold one of ``SOUL_LOG_ANALYSIS_MAX_IN_FLIGHT`` global analysis slots.
+
+    Every slot is its own cache key, claimed atomically with ``cache.add()``
+    and deleted on release. Raises AnalysisCapacityExceeded when every slot is
+    taken. Each key expires after ``SOUL_LOG_ANALYSIS_SLOT_TTL`` seconds, so a
+    slot leaked by a killed worker is reclaimed without affecting the others.
+    """
+    keys = _slot_keys()
+    if not keys:
+        yield
+        return
+
+    # Start at a random slot so concurrent requests don't all contend for slot 0.
+    offset = random.randrange(len(keys))
+    for key in keys[offset:] + keys[:offset]:
+        if default_cache.add(key, 1, timeout=settings.SOUL_LOG_ANALYSIS_SLOT_TTL):
+            break
+    else:
+        record_shed('analysis')
+        raise AnalysisCapacityExceeded(wait=settings.SOUL_LOG_ANALYSIS_RETRY_AFTER)
+
+    try:
+        yield
+    finally:
+        default_cache.delete(key)
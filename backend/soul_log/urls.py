@@ -13,6 +13,10 @@ urlpatterns = [
     # Main app endpoints
     path('profile/', views.UserProfileView.as_view(), name='user-profile'),
     path('entries/', views.JournalEntryListCreateView.as_view(), name='journal-entries'),
+    path('entries/export/', views.export_entries, name='journal-entries-export'),
     path('entries/<int:pk>/', views.JournalEntryDetailView.as_view(), name='journal-entry-detail'),
+    path('entries/<int:pk>/similar/', views.similar_entries, name='journal-entry-similar'),
     path('dashboard/', views.dashboard_stats, name='dashboard-stats'),
+    path('digests/<str:period>/', views.latest_digest, name='latest-digest'),
+    path('metrics/', views.service_metrics, name='service-metrics'),
 ]
@@ -1,23 +1,32 @@
 # backend/soul_log/views.py
 
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import APIException
 from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.response import Response
 from django.contrib.auth.models import User
 from django.shortcuts import get_object_or_404
-from django.db import models
+from django.http import Http404
+from django.db import models, transaction
 import json
 import re
 from rest_framework.authentication import TokenAuthentication
 
-from .models import UserProfile, JournalEntry, InsightTemplate, GeneratedInsight
+from .models import UserProfile, JournalEntry, InsightTemplate, GeneratedInsight, ArchivedJournalEntry, ReflectionDigest
 from .serializers import (
     UserProfileSerializer, 
     JournalEntrySerializer, 
     JournalEntryWithInsightsSerializer,
+    JournalEntryListSerializer,
+    ArchivedJournalEntrySerializer,
+    SimilarEntrySerializer,
+    ReflectionDigestSerializer,
     GeneratedInsightSerializer,
 )
 from .ai_service import AIInsightService  # Hugging Face AI service import
+from . import idempotency
+from .cache import user_cache, profile_key, dashboard_key
+from .throttling import EntryCreateThrottle, analysis_slot, analysis_in_flight, shed_counts
 
 
 class UserProfileView(generics.RetrieveUpdateAPIView):
@@ -28,6 +37,18 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     def get_object(self):
         profile, created = UserProfile.objects.get_or_create(user=self.request.user)
         return profile
+    
+    def retrieve(self, request, *args, **kwargs):
+        return Response(get_profile_data(request.user))
+
+
+def get_profile_data(user):
+    """Return the user's serialized profile, creating the profile if needed (cached)"""
+    def build():
+        profile, created = UserProfile.objects.get_or_create(user=user)
+        return dict(UserProfileSerializer(profile).data)
+    return user_cache.get_or_set(profile_key(user.pk), build)
+
 
 class JournalEntryListCreateView(generics.ListCreateAPIView):
     serializer_class = JournalEntryWithInsightsSerializer
@@ -35,27 +56,65 @@ class JournalEntryListCreateView(generics.ListCreateAPIView):
     authentication_classes = [TokenAuthentication]
     
     def get_queryset(self):
-        return JournalEntry.objects.filter(user=self.request.user)
+        return JournalEntry.objects.filter(user=self.request.user).prefetch_related('insights')
+    
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return JournalEntryListSerializer
+        return JournalEntryWithInsightsSerializer
+    
+    def get_throttles(self):
+        throttles = super().get_throttles()
+        if self.request.method == 'POST':
+            throttles.append(EntryCreateThrottle())
+        return throttles
+    
+    def create(self, request, *args, **kwargs):
+        # Retries carrying the same Idempotency-Key replay the first response
+        # instead of creating (and analyzing) a duplicate entry.
+        key = request.headers.get('Idempotency-Key')
+        if not key:
+            return super().create(request, *args, **kwargs)
+        if len(key) > idempotency.MAX_KEY_LENGTH:
+            return Response({'error': 'Idempotency-Key is too long'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        record, replay = idempotency.claim(request.user, key, idempotency.request_fingerprint(request.data))
+        if replay is not None:
+            return replay
+        
+        try:
+            # The entry, its insights and the stored response commit together,
+            # so a released key never leaves a saved entry behind for the
+            # retry to duplicate.
+            with transaction.atomic():
+                response = super().create(request, *args, **kwargs)
+                if status.is_success(response.status_code):
+                    idempotency.complete(record, response)
+        except Exception:
+            idempotency.release(record)
+            raise
+        
+        if not status.is_success(response.status_code):
+            idempotency.release(record)
+        return response
     
     def perform_create(self, serializer):
-        journal_entry = serializer.save(user=self.request.user)
-        self.analyze_and_generate_insights(journal_entry)
+        # Shed the request before saving anything if analysis is saturated.
+        with analysis_slot():
+            journal_entry = serializer.save(user=self.request.user)
+            self.analyze_and_generate_insights(journal_entry)
+            # Imported here so NumPy only loads on paths that need it.
+            from .similarity import update_entry_embedding
+            update_entry_embedding(journal_entry)
     
     def analyze_and_generate_insights(self, journal_entry):
         """Analyze journal entry and generate AI insights using Hugging Face"""
-        user_profile, created = UserProfile.objects.get_or_create(
-            user=journal_entry.user,
-            defaults={
-                'prefer_biblical': True,
-                'prefer_islamic': True,
-                'prefer_psychological': True
-            }
-        )
+        profile_data = get_profile_data(journal_entry.user)
         
         preferences = {
-            'prefer_psychological': user_profile.prefer_psychological,
-            'prefer_biblical': user_profile.prefer_biblical,
-            'prefer_islamic': user_profile.prefer_islamic,
+            'prefer_psychological': profile_data['prefer_psychological'],
+            'prefer_biblical': profile_data['prefer_biblical'],
+            'prefer_islamic': profile_data['prefer_islamic'],
         }
         
         ai_service = AIInsightService()
@@ -80,6 +139,27 @@ class JournalEntryListCreateView(generics.ListCreateAPIView):
                     scripture_reference=insight_data.get('scripture_reference', '')
                 )
 
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'The entry was modified by another request. Reload it and try again.'
+    default_code = 'precondition_failed'
+
+class EditConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'The entry was modified by another request while saving. Reload it and try again.'
+    default_code = 'edit_conflict'
+
+def parse_if_match(request):
+    """Return the entry version from an If-Match header, or None when absent or '*'"""
+    value = request.headers.get('If-Match', '').strip()
+    if not value or value == '*':
+        return None
+    value = value.removeprefix('W/').strip('"')
+    try:
+        return int(value)
+    except ValueError:
+        raise PreconditionFailed('If-Match must be an entry version ETag.')
+
 class JournalEntryDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = JournalEntryWithInsightsSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -87,18 +167,145 @@ class JournalEntryDetailView(generics.RetrieveUpdateDestroyAPIView):
     
     def get_queryset(self):
         return JournalEntry.objects.filter(user=self.request.user)
+    
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            response = super().retrieve(request, *args, **kwargs)
+            response['ETag'] = f'"{response.data["version"]}"'
+            return response
+        except Http404:
+            # Old entries live in the archive table; serve them read-only.
+            archived_entry = get_object_or_404(
+                ArchivedJournalEntry.objects.prefetch_related('insights'),
+                user=request.user,
+                pk=kwargs['pk'],
+            )
+            response = Response(ArchivedJournalEntrySerializer(archived_entry).data)
+            response['ETag'] = f'"{response.data["version"]}"'
+            return response
+    
+    def update(self, request, *args, **kwargs):
+        try:
+            response = super().update(request, *args, **kwargs)
+        except Http404:
+            if ArchivedJournalEntry.objects.filter(user=request.user, pk=kwargs['pk']).exists():
+                return Response(
+                    {'error': 'Archived entries are read-only; they can still be viewed or deleted.'},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            raise
+        response['ETag'] = f'"{response.data["version"]}"'
+        return response
+    
+    def perform_update(self, serializer):
+        from .similarity import update_entry_embedding
+        
+        entry = serializer.instance
+        if_match_version = parse_if_match(self.request)
+        expected_version = entry.version if if_match_version is None else if_match_version
+        
+        with transaction.atomic():
+            # Compare-and-swap on the version so concurrent updates can't
+            # silently overwrite each other.
+            claimed = JournalEntry.objects.filter(pk=entry.pk, version=expected_version).update(
+                version=models.F('version') + 1
+            )
+            if not claimed:
+                # 412 only when the client's own If-Match was false; otherwise
+                # it simply lost a race with another writer.
+                if if_match_version is None:
+                    raise EditConflict()
+                raise PreconditionFailed()
+            journal_entry = serializer.save(version=expected_version + 1)
+        update_entry_embedding(journal_entry)
+    
+    def destroy(self, request, *args, **kwargs):
+        try:
+            return super().destroy(request, *args, **kwargs)
+        except Http404:
+            # Archived entries must stay deletable; this cascades to their insights.
+            archived_entry = get_object_or_404(ArchivedJournalEntry, user=request.user, pk=kwargs['pk'])
+            self.perform_destroy(archived_entry)
+            return Response(status=status.HTTP_204_NO_CONTENT)
+    
+    def perform_destroy(self, instance):
+        from .similarity import delete_entry_embedding
+        delete_entry_embedding(instance)
+        instance.delete()
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+@authentication_classes([TokenAuthentication])
+def similar_entries(request, pk):
+    """Get the user's entries most similar to this one, live or archived"""
+    from .similarity import get_user_index
+    
+    try:
+        k = min(max(int(request.query_params.get('k', 5)), 1), 20)
+    except ValueError:
+        return Response({'error': 'k must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    index = get_user_index(request.user.pk)
+    if pk not in index.positions:
+        # Not indexed yet: entries written before the index existed are
+        # backfilled by `manage.py build_similarity_index`.
+        if not JournalEntry.objects.filter(user=request.user, pk=pk).exists():
+            get_object_or_404(ArchivedJournalEntry, user=request.user, pk=pk)
+        return Response([])
+    
+    scores = dict(index.most_similar(pk, k))
+    entries = {
+        entry.pk: entry
+        for model in (JournalEntry, ArchivedJournalEntry)
+        for entry in model.objects.filter(user=request.user, pk__in=scores)
+    }
+    # Vectors can outlive their entry (e.g. deleted through the admin); skip those.
+    results = []
+    for entry_id, score in scores.items():
+        if entry_id in entries:
+            entries[entry_id].similarity = score
+            results.append(entries[entry_id])
+    return Response(SimilarEntrySerializer(results, many=True).data)
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+@authentication_classes([TokenAuthentication])
+def export_entries(request):
+    """Export all of the user's entries, including archived ones, newest first"""
+    entries = JournalEntry.objects.filter(user=request.user).prefetch_related('insights')
+    archived_entries = ArchivedJournalEntry.objects.filter(user=request.user).prefetch_related('insights')
+    # Everything in the archive is older than every live entry.
+    return Response(
+        JournalEntryListSerializer(entries, many=True).data
+        + JournalEntryListSerializer(archived_entries, many=True).data
+    )
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 @authentication_classes([TokenAuthentication])
 def dashboard_stats(request):
     """Get dashboard statistics for the user"""
-    entries = JournalEntry.objects.filter(user=request.user)
+    return Response(user_cache.get_or_set(
+        dashboard_key(request.user.pk),
+        lambda: build_dashboard_stats(request.user),
+    ))
+
+
+def build_dashboard_stats(user):
+    entries = JournalEntry.objects.filter(user=user)
     
-    total_entries = entries.count()
-    avg_mood = entries.exclude(mood_rating__isnull=True).aggregate(
-        avg_mood=models.Avg('mood_rating')
-    )['avg_mood'] or 0
+    # Totals cover archived entries too; sums are combined so the average is exact.
+    totals = [
+        queryset.aggregate(
+            count=models.Count('id'),
+            mood_sum=models.Sum('mood_rating'),
+            mood_count=models.Count('mood_rating'),
+        )
+        for queryset in (entries, ArchivedJournalEntry.objects.filter(user=user))
+    ]
+    total_entries = sum(t['count'] for t in totals)
+    mood_count = sum(t['mood_count'] for t in totals)
+    avg_mood = sum(t['mood_sum'] or 0 for t in totals) / mood_count if mood_count else 0
     
     recent_entries = entries.order_by('-created_at')[:7]
     sentiment_trend = [
@@ -109,8 +316,33 @@ def dashboard_stats(request):
         } for entry in recent_entries
     ]
     
-    return Response({
+    return {
         'total_entries': total_entries,
         'average_mood': round(avg_mood, 1),
         'sentiment_trend': sentiment_trend,
-    })
\ No newline at end of file
+    }
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+@authentication_classes([TokenAuthentication])
+def latest_digest(request, period):
+    """Get the user's most recent weekly or monthly digest"""
+    if period not in dict(ReflectionDigest.PERIOD_CHOICES):
+        return Response({'error': 'period must be "week" or "month"'}, status=status.HTTP_400_BAD_REQUEST)
+    digest = ReflectionDigest.objects.filter(user=request.user, period=period).order_by('-period_start').first()
+    if digest is None:
+        return Response({'error': 'No digest available yet'}, status=status.HTTP_404_NOT_FOUND)
+    return Response(ReflectionDigestSerializer(digest).data)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+@authentication_classes([TokenAuthentication])
+def service_metrics(request):
+    """Get load-shedding and cache counters for staff"""
+    return Response({
+        'shed_requests': shed_counts(),
+        'analysis_in_flight': analysis_in_flight(),
+        'user_cache': user_cache.stats(),
+    })